@@ -52,14 +52,13 @@ class AdvancedTooltipManager:
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS custom_acronyms (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                acronym TEXT UNIQUE NOT NULL,
+                acronym TEXT PRIMARY KEY,
                 definition TEXT NOT NULL,
                 category TEXT,
                 priority TEXT DEFAULT 'medium',
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
+            ) WITHOUT ROWID
         ''')
         
         conn.commit()
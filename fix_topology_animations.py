@@ -7,8 +7,13 @@ Automatically integrates the topology animation fix into the HTML file
 import os
 import re
 
+SCRIPT_SRC = '/static/js/topology_animations.js'
+
 def fix_topology_animations():
-    """Fix the mesh topology animation issues"""
+    """Fix the mesh topology animation issues
+    
+    Returns the resulting HTML content on success, or None on failure.
+    """
     
     html_file = 'templates/index.html'
     js_file = 'static/js/topology_animations.js'
@@ -16,11 +21,11 @@ def fix_topology_animations():
     # Check if files exist
     if not os.path.exists(html_file):
         print(f"❌ Error: {html_file} not found!")
-        return False
+        return None
         
     if not os.path.exists(js_file):
         print(f"❌ Error: {js_file} not found!")
-        return False
+        return None
     
     # Read the HTML file
     try:
@@ -28,40 +33,39 @@ def fix_topology_animations():
             html_content = f.read()
     except Exception as e:
         print(f"❌ Error reading HTML file: {e}")
-        return False
+        return None
     
     # Check if the script is already included
-    if '/static/js/topology_animations.js' in html_content:
+    if SCRIPT_SRC in html_content:
         print("✅ Topology animations script is already included!")
-        return True
+        return html_content
     
     # Find the closing body tag and add the script before it
-    script_tag = '    <script src="/static/js/topology_animations.js"></script>\n'
+    script_tag = f'    <script src="{SCRIPT_SRC}"></script>\n'
     
     if '</body>' in html_content:
         # Insert before closing body tag
-        html_content = html_content.replace('</body>', f'{script_tag}</body>')
+        new_content = html_content.replace('</body>', f'{script_tag}</body>')
         
         # Write back to file
         try:
             with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.write(new_content)
             print("✅ Successfully integrated topology animation fix!")
             print("📁 Added script reference to HTML file")
-            return True
+            return new_content
         except Exception as e:
             print(f"❌ Error writing HTML file: {e}")
-            return False
+            return None
     else:
         print("❌ Could not find </body> tag in HTML file!")
-        return False
+        return None
 
-def verify_fix():
-    """Verify that the fix is working"""
+def verify_fix(html_content):
+    """Verify that the fix is working against the already-loaded HTML content"""
     print("\n🔍 Verifying the fix...")
     
     js_file = 'static/js/topology_animations.js'
-    html_file = 'templates/index.html'
     
     # Check JavaScript file
     if os.path.exists(js_file):
@@ -79,14 +83,11 @@ def verify_fix():
         return False
     
     # Check HTML integration
-    if os.path.exists(html_file):
-        with open(html_file, 'r') as f:
-            html_content = f.read()
-            if '/static/js/topology_animations.js' in html_content:
-                print("✅ Script correctly referenced in HTML")
-            else:
-                print("❌ Script not referenced in HTML file")
-                return False
+    if SCRIPT_SRC in html_content:
+        print("✅ Script correctly referenced in HTML")
+    else:
+        print("❌ Script not referenced in HTML file")
+        return False
     
     return True
 
@@ -109,8 +110,9 @@ def main():
     print(f"📂 Working in: {os.getcwd()}")
     
     # Apply the fix
-    if fix_topology_animations():
-        if verify_fix():
+    html_content = fix_topology_animations()
+    if html_content is not None:
+        if verify_fix(html_content):
             print("\n🎉 Topology animation fix applied successfully!")
             print("\n📋 Next Steps:")
             print("1. Start your Flask server: python flask_telecom_server.py")
@@ -4,7 +4,7 @@ Enhanced Flask Telecommunications Laboratory with Tooltip System
 Professional web application for 5G/6G telecommunications education
 """
 
-from flask import Flask, render_template, jsonify, send_from_directory, request
+from flask import Flask, Response, render_template, jsonify, send_from_directory, request
 import json
 import os
 from datetime import datetime
@@ -13,11 +13,144 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import io
-import base64
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib module
+except ImportError:
+    import base64
+
+# Optional Rust JSON encoder for the plot endpoints
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional JIT for the signal synthesis kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional response compression for the large base64-in-JSON plot payloads
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'telecom_lab_2025'
 
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+
+# Number of signal samples drawn in the /generate_signals plot
+PLOT_LEN = 200
+
+# PNG encoding for every plot: zlib level 1 through Pillow and no tEXt
+# metadata chunk; the payload is base64'd into JSON so size matters less
+PNG_SAVE_KWARGS = {
+    'format': 'png',
+    'dpi': 300,
+    'bbox_inches': 'tight',
+    'pil_kwargs': {'compress_level': 1, 'optimize': False},
+    'metadata': {'Software': None},
+}
+
+# Constellation geometry per modulation: (I points, Q points, colors, marker size, axis limit)
+_QAM16_LEVELS = np.array([-3, -1, 1, 3])
+_CONSTELLATIONS = {
+    'BPSK': (np.array([-1, 1]), np.zeros(2), ['red', 'blue'], 200, 2),
+    'QPSK': (np.array([1, -1, -1, 1]) / np.sqrt(2), np.array([1, 1, -1, -1]) / np.sqrt(2),
+             ['red', 'blue', 'green', 'orange'], 200, 1.5),
+    '16-QAM': (np.repeat(_QAM16_LEVELS, 4), np.tile(_QAM16_LEVELS, 4), 'purple', 150, 5),
+}
+
+def _build_signal_loop(symbols, samples_per_symbol, t_step, noise):
+    """Fused baseband expansion, carrier multiply, noise add and SNR in one pass"""
+    n = noise.shape[0]
+    t = np.empty(n)
+    signal = np.empty(n)
+    noisy = np.empty(n)
+    signal_power = 0.0
+    noise_power = 0.0
+    for i in range(n):
+        t[i] = i * t_step
+        s = symbols[i // samples_per_symbol] * np.cos(2 * np.pi * 0.1 * t[i])
+        signal[i] = s
+        noisy[i] = s + noise[i]
+        signal_power += s * s
+        noise_power += noise[i] * noise[i]
+    if noise_power > 0:
+        snr_db = 10 * np.log10(signal_power / noise_power)
+    else:
+        snr_db = np.inf
+    return t, signal, noisy, snr_db
+
+def _build_signal_numpy(symbols, samples_per_symbol, t_step, noise):
+    """NumPy equivalent of _build_signal_loop for when Numba is not installed"""
+    n = noise.shape[0]
+    t = np.arange(n) * t_step
+    signal = np.repeat(symbols, samples_per_symbol)[:n] * np.cos(2 * np.pi * 0.1 * t)
+    noisy = signal + noise
+    noise_power = np.mean(noise**2)
+    snr_db = 10 * np.log10(np.mean(signal**2) / noise_power) if noise_power > 0 else float('inf')
+    return t, signal, noisy, snr_db
+
+if NUMBA_AVAILABLE:
+    _build_signal = njit(cache=True, fastmath=True)(_build_signal_loop)
+    # Compile (or load from the on-disk cache) now rather than on the first request
+    _build_signal(np.ones(1, dtype=np.int64), 1, 1.0, np.zeros(1))
+else:
+    _build_signal = _build_signal_numpy
+
+def json_bytes(obj):
+    """Serialise obj to compact JSON bytes, via orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def fast_jsonify(obj, status=200):
+    """jsonify() replacement that skips Flask's stdlib JSON provider"""
+    return Response(json_bytes(obj), status=status, mimetype='application/json')
+
+# pyplot keeps global state and is not thread-safe, so all drawing and
+# encoding is serialised onto one render thread; request threads just wait
+_RENDER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='plot-render')
+
+def _draw_and_encode(draw, args):
+    """Run a draw function and base64-encode the resulting figure as PNG"""
+    try:
+        draw(*args)
+        img_buffer = io.BytesIO()
+        plt.savefig(img_buffer, **PNG_SAVE_KWARGS)
+    finally:
+        plt.close('all')
+    with img_buffer.getbuffer() as png:
+        return base64.b64encode(png)
+
+def render_plot(draw, *args):
+    """Render draw(*args) on the plot render thread and return base64 PNG bytes"""
+    return _RENDER_POOL.submit(_draw_and_encode, draw, args).result()
+
+def plot_response(plot_b64, **fields):
+    """Build a JSON plot response around an already base64-encoded PNG
+    
+    The base64 bytes are spliced into the JSON body as-is, so the large
+    string never goes through a JSON encoder. Any extra fields are
+    serialised alongside it.
+    """
+    parts = [b'{"success":true,"plot":"', plot_b64, b'"']
+    if fields:
+        parts += [b',', json_bytes(fields)[1:-1]]
+    parts.append(b'}')
+    return Response(b''.join(parts), mimetype='application/json')
+
 # Load acronyms database
 def load_acronyms():
     """Load the telecommunications acronyms database"""
@@ -134,6 +267,34 @@ def get_acronym(acronym):
             'error': str(e)
         }), 500
 
+def _draw_signals(bits, t, signal, noisy_signal, num_bits, modulation, snr_db):
+    """Draw the bit stream, clean signal and noisy received signal"""
+    # Create plot
+    plt.figure(figsize=(12, 8))
+    
+    plt.subplot(3, 1, 1)
+    plt.plot(bits[:20], 'bo-', linewidth=2, markersize=8)
+    plt.title(f'Digital Bits (First 20 of {num_bits})')
+    plt.ylabel('Bit Value')
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(3, 1, 2)
+    plt.plot(t, signal, 'r-', linewidth=1.5, label='Clean Signal')
+    plt.title(f'{modulation} Modulated Signal')
+    plt.ylabel('Amplitude')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(3, 1, 3)
+    plt.plot(t, noisy_signal, 'g-', linewidth=1.5, label='Noisy Signal')
+    plt.title(f'Received Signal (SNR = {snr_db:.1f} dB)')
+    plt.ylabel('Amplitude')
+    plt.xlabel('Sample Index')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+
 @app.route('/generate_signals', methods=['POST'])
 def generate_signals():
     """Generate telecommunication signals for analysis"""
@@ -144,338 +305,251 @@ def generate_signals():
         noise_level = data.get('noise_level', 0.1)
         
         # Generate signal data
-        np.random.seed(42)  # For reproducibility
-        bits = np.random.randint(0, 2, num_bits)
+        rng = np.random.default_rng(42)  # Per-request generator for reproducibility
+        bits = rng.integers(0, 2, num_bits)
         
-        # Simple signal generation for demonstration
+        # Simple signal generation for demonstration. Only the first
+        # PLOT_LEN samples are ever plotted, so only those are synthesised.
         samples_per_symbol = 10
-        t = np.linspace(0, num_bits, num_bits * samples_per_symbol)
+        num_samples = num_bits * samples_per_symbol
+        plot_len = min(PLOT_LEN, num_samples)
+        plot_symbols = -(-plot_len // samples_per_symbol)
+        t_step = num_bits / max(num_samples - 1, 1)
         
         if modulation == 'BPSK':
-            symbols = 2 * bits - 1  # Map 0->-1, 1->+1
-            baseband = np.repeat(symbols, samples_per_symbol)
-            carrier = np.cos(2 * np.pi * 0.1 * t)
-            signal = baseband * carrier
+            symbols = 2 * bits[:plot_symbols] - 1  # Map 0->-1, 1->+1
         elif modulation == 'QPSK':
             # Simplified QPSK
-            symbols = 2 * bits - 1
-            baseband = np.repeat(symbols, samples_per_symbol)
-            carrier = np.cos(2 * np.pi * 0.1 * t)
-            signal = baseband * carrier
+            symbols = 2 * bits[:plot_symbols] - 1
         elif modulation == '16-QAM':
             # Simplified 16-QAM
-            symbols = 2 * bits - 1
-            baseband = np.repeat(symbols, samples_per_symbol)
-            carrier = np.cos(2 * np.pi * 0.1 * t)
-            signal = baseband * carrier
+            symbols = 2 * bits[:plot_symbols] - 1
         
-        # Add noise
-        noise = noise_level * np.random.randn(len(signal))
-        noisy_signal = signal + noise
+        # Carrier, noise and SNR (over the plotted window) in one fused kernel
+        noise = noise_level * rng.standard_normal(plot_len)
+        t, signal, noisy_signal, snr_db = _build_signal(symbols, samples_per_symbol, t_step, noise)
+        snr_db = float(snr_db)
         
-        # Calculate SNR
-        signal_power = np.mean(signal**2)
-        noise_power = np.mean(noise**2)
-        snr_db = 10 * np.log10(signal_power / noise_power) if noise_power > 0 else float('inf')
+        plot_b64 = render_plot(_draw_signals, bits, t, signal, noisy_signal,
+                               num_bits, modulation, snr_db)
         
-        # Create plot
-        plt.figure(figsize=(12, 8))
-        
-        plt.subplot(3, 1, 1)
-        plt.plot(bits[:20], 'bo-', linewidth=2, markersize=8)
-        plt.title(f'Digital Bits (First 20 of {num_bits})')
-        plt.ylabel('Bit Value')
-        plt.grid(True, alpha=0.3)
-        
-        plt.subplot(3, 1, 2)
-        plt.plot(t[:200], signal[:200], 'r-', linewidth=1.5, label='Clean Signal')
-        plt.title(f'{modulation} Modulated Signal')
-        plt.ylabel('Amplitude')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        plt.subplot(3, 1, 3)
-        plt.plot(t[:200], noisy_signal[:200], 'g-', linewidth=1.5, label='Noisy Signal')
-        plt.title(f'Received Signal (SNR = {snr_db:.1f} dB)')
-        plt.ylabel('Amplitude')
-        plt.xlabel('Sample Index')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        # Convert plot to base64 string
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close()
-        
-        return jsonify({
-            'success': True,
-            'plot': img_base64,
-            'result': {
+        return plot_response(
+            plot_b64,
+            result={
                 'bits': bits.tolist(),
                 'modulation': modulation,
-                'samples': len(signal),
+                'samples': num_samples,
                 'snr_db': snr_db
             }
-        })
+        )
         
     except Exception as e:
-        return jsonify({
+        return fast_jsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+
+def _draw_constellation(modulation):
+    """Draw the constellation diagram for a modulation scheme"""
+    plt.figure(figsize=(8, 8))
+    
+    constellation = _CONSTELLATIONS.get(modulation)
+    if constellation:
+        points_i, points_q, colors, size, limit = constellation
+        plt.scatter(points_i, points_q, s=size, c=colors, alpha=0.8)
+        plt.xlim(-limit, limit)
+        plt.ylim(-limit, limit)
+    
+    plt.title(f'{modulation} Constellation Diagram', fontsize=16, fontweight='bold')
+    plt.xlabel('In-phase (I)', fontsize=14)
+    plt.ylabel('Quadrature (Q)', fontsize=14)
+    plt.grid(True, alpha=0.3)
+    plt.axhline(y=0, color='k', linestyle='-', alpha=0.5)
+    plt.axvline(x=0, color='k', linestyle='-', alpha=0.5)
 
 @app.route('/constellation/<modulation>')
 def constellation_diagram(modulation):
     """Generate constellation diagram for specified modulation"""
     try:
-        plt.figure(figsize=(8, 8))
-        
-        if modulation == 'BPSK':
-            points = np.array([-1, 1])
-            plt.scatter(points, [0, 0], s=200, c=['red', 'blue'], alpha=0.8)
-            plt.xlim(-2, 2)
-            plt.ylim(-2, 2)
-            
-        elif modulation == 'QPSK':
-            points_i = np.array([1, -1, -1, 1]) / np.sqrt(2)
-            points_q = np.array([1, 1, -1, -1]) / np.sqrt(2)
-            colors = ['red', 'blue', 'green', 'orange']
-            plt.scatter(points_i, points_q, s=200, c=colors, alpha=0.8)
-            plt.xlim(-1.5, 1.5)
-            plt.ylim(-1.5, 1.5)
-            
-        elif modulation == '16-QAM':
-            points_i = []
-            points_q = []
-            for i in [-3, -1, 1, 3]:
-                for q in [-3, -1, 1, 3]:
-                    points_i.append(i)
-                    points_q.append(q)
-            plt.scatter(points_i, points_q, s=150, c='purple', alpha=0.8)
-            plt.xlim(-5, 5)
-            plt.ylim(-5, 5)
-        
-        plt.title(f'{modulation} Constellation Diagram', fontsize=16, fontweight='bold')
-        plt.xlabel('In-phase (I)', fontsize=14)
-        plt.ylabel('Quadrature (Q)', fontsize=14)
-        plt.grid(True, alpha=0.3)
-        plt.axhline(y=0, color='k', linestyle='-', alpha=0.5)
-        plt.axvline(x=0, color='k', linestyle='-', alpha=0.5)
-        
-        # Convert plot to base64
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close()
-        
-        return jsonify({
-            'success': True,
-            'modulation': modulation,
-            'plot': img_base64
-        })
+        plot_b64 = render_plot(_draw_constellation, modulation)
+        return plot_response(plot_b64, modulation=modulation)
         
     except Exception as e:
-        return jsonify({
+        return fast_jsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+
+def _draw_performance():
+    """Draw theoretical BER vs SNR curves"""
+    plt.figure(figsize=(12, 8))
+    
+    snr_db = np.linspace(0, 15, 31)
+    snr_linear = 10**(snr_db/10)
+    
+    # Theoretical BER curves (simplified)
+    ber_bpsk = 0.5 * np.exp(-snr_linear/2)
+    ber_qpsk = 0.5 * np.exp(-snr_linear/2)
+    ber_16qam = 0.75 * np.exp(-snr_linear/10)
+    
+    plt.semilogy(snr_db, ber_bpsk, 'b-', linewidth=3, label='BPSK', marker='o')
+    plt.semilogy(snr_db, ber_qpsk, 'r-', linewidth=3, label='QPSK', marker='s')
+    plt.semilogy(snr_db, ber_16qam, 'g-', linewidth=3, label='16-QAM', marker='^')
+    
+    plt.title('BER vs SNR Performance Comparison', fontsize=16, fontweight='bold')
+    plt.xlabel('SNR (dB)', fontsize=14)
+    plt.ylabel('Bit Error Rate (BER)', fontsize=14)
+    plt.grid(True, alpha=0.3)
+    plt.legend(fontsize=12)
+    plt.ylim(1e-6, 1)
 
 @app.route('/performance_analysis')
 def performance_analysis():
     """Generate BER vs SNR performance analysis"""
     try:
-        plt.figure(figsize=(12, 8))
-        
-        snr_db = np.linspace(0, 15, 31)
-        snr_linear = 10**(snr_db/10)
-        
-        # Theoretical BER curves (simplified)
-        ber_bpsk = 0.5 * np.exp(-snr_linear/2)
-        ber_qpsk = 0.5 * np.exp(-snr_linear/2)
-        ber_16qam = 0.75 * np.exp(-snr_linear/10)
-        
-        plt.semilogy(snr_db, ber_bpsk, 'b-', linewidth=3, label='BPSK', marker='o')
-        plt.semilogy(snr_db, ber_qpsk, 'r-', linewidth=3, label='QPSK', marker='s')
-        plt.semilogy(snr_db, ber_16qam, 'g-', linewidth=3, label='16-QAM', marker='^')
-        
-        plt.title('BER vs SNR Performance Comparison', fontsize=16, fontweight='bold')
-        plt.xlabel('SNR (dB)', fontsize=14)
-        plt.ylabel('Bit Error Rate (BER)', fontsize=14)
-        plt.grid(True, alpha=0.3)
-        plt.legend(fontsize=12)
-        plt.ylim(1e-6, 1)
-        
-        # Convert plot to base64
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close()
-        
-        return jsonify({
-            'success': True,
-            'plot': img_base64
-        })
+        plot_b64 = render_plot(_draw_performance)
+        return plot_response(plot_b64)
         
     except Exception as e:
-        return jsonify({
+        return fast_jsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+
+def _draw_5g_comparison():
+    """Draw peak data rate and latency bars per technology generation"""
+    plt.figure(figsize=(14, 10))
+    
+    # Data for comparison
+    technologies = ['3G', '4G/LTE', '5G Sub-6', '5G mmWave', '6G (Future)']
+    peak_speeds = [2, 100, 1000, 10000, 100000]  # Mbps
+    latencies = [100, 20, 5, 1, 0.1]  # ms
+    
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    
+    # Peak speeds comparison
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57']
+    bars1 = ax1.bar(technologies, peak_speeds, color=colors, alpha=0.8)
+    ax1.set_title('Peak Data Rates by Generation', fontsize=16, fontweight='bold')
+    ax1.set_ylabel('Peak Speed (Mbps)', fontsize=14)
+    ax1.set_yscale('log')
+    ax1.grid(True, alpha=0.3, axis='y')
+    
+    # Add value labels on bars
+    for bar, speed in zip(bars1, peak_speeds):
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                f'{speed:,}', ha='center', va='bottom', fontweight='bold')
+    
+    # Latency comparison
+    bars2 = ax2.bar(technologies, latencies, color=colors, alpha=0.8)
+    ax2.set_title('Latency Comparison by Generation', fontsize=16, fontweight='bold')
+    ax2.set_ylabel('Latency (ms)', fontsize=14)
+    ax2.set_xlabel('Technology Generation', fontsize=14)
+    ax2.set_yscale('log')
+    ax2.grid(True, alpha=0.3, axis='y')
+    
+    # Add value labels on bars
+    for bar, latency in zip(bars2, latencies):
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                f'{latency}', ha='center', va='bottom', fontweight='bold')
+    
+    plt.tight_layout()
 
 @app.route('/5g_comparison')
 def g5_comparison():
     """Generate 5G technology comparison"""
     try:
-        plt.figure(figsize=(14, 10))
-        
-        # Data for comparison
-        technologies = ['3G', '4G/LTE', '5G Sub-6', '5G mmWave', '6G (Future)']
-        peak_speeds = [2, 100, 1000, 10000, 100000]  # Mbps
-        latencies = [100, 20, 5, 1, 0.1]  # ms
-        
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-        
-        # Peak speeds comparison
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57']
-        bars1 = ax1.bar(technologies, peak_speeds, color=colors, alpha=0.8)
-        ax1.set_title('Peak Data Rates by Generation', fontsize=16, fontweight='bold')
-        ax1.set_ylabel('Peak Speed (Mbps)', fontsize=14)
-        ax1.set_yscale('log')
-        ax1.grid(True, alpha=0.3, axis='y')
-        
-        # Add value labels on bars
-        for bar, speed in zip(bars1, peak_speeds):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{speed:,}', ha='center', va='bottom', fontweight='bold')
-        
-        # Latency comparison
-        bars2 = ax2.bar(technologies, latencies, color=colors, alpha=0.8)
-        ax2.set_title('Latency Comparison by Generation', fontsize=16, fontweight='bold')
-        ax2.set_ylabel('Latency (ms)', fontsize=14)
-        ax2.set_xlabel('Technology Generation', fontsize=14)
-        ax2.set_yscale('log')
-        ax2.grid(True, alpha=0.3, axis='y')
-        
-        # Add value labels on bars
-        for bar, latency in zip(bars2, latencies):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{latency}', ha='center', va='bottom', fontweight='bold')
-        
-        plt.tight_layout()
-        
-        # Convert plot to base64
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close()
-        
-        return jsonify({
-            'success': True,
-            'plot': img_base64
-        })
+        plot_b64 = render_plot(_draw_5g_comparison)
+        return plot_response(plot_b64)
         
     except Exception as e:
-        return jsonify({
+        return fast_jsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+
+def _draw_network_topology(topology):
+    """Draw a star, mesh or ring network topology"""
+    plt.figure(figsize=(10, 8))
+    
+    if topology == 'star':
+        # Central hub
+        plt.scatter(0, 0, s=1000, c='gold', marker='*', edgecolors='black', linewidth=2, label='Hub')
+        plt.text(0, 0, 'HUB', ha='center', va='center', fontweight='bold')
+        
+        # Surrounding nodes
+        angles = np.linspace(0, 2*np.pi, 7)[:-1]  # 6 nodes
+        radius = 3
+        for i, angle in enumerate(angles):
+            x = radius * np.cos(angle)
+            y = radius * np.sin(angle)
+            plt.scatter(x, y, s=400, c='lightblue', edgecolors='black', linewidth=2)
+            plt.plot([0, x], [0, y], 'k-', linewidth=2, alpha=0.7)
+            plt.text(x, y, f'PC{i+1}', ha='center', va='center', fontweight='bold', fontsize=10)
+        
+        plt.title('Star Network Topology', fontsize=16, fontweight='bold')
+        
+    elif topology == 'mesh':
+        # Mesh topology - all nodes connected to all
+        positions = [(0, 2), (2, 1), (2, -1), (0, -2), (-2, -1), (-2, 1)]
+        
+        # Draw all connections
+        for i, pos1 in enumerate(positions):
+            for j, pos2 in enumerate(positions[i+1:], i+1):
+                plt.plot([pos1[0], pos2[0]], [pos1[1], pos2[1]], 'k-', linewidth=1, alpha=0.5)
+        
+        # Draw nodes
+        for i, (x, y) in enumerate(positions):
+            plt.scatter(x, y, s=400, c='lightgreen', edgecolors='black', linewidth=2)
+            plt.text(x, y, chr(65+i), ha='center', va='center', fontweight='bold', fontsize=12)
+        
+        plt.title('Mesh Network Topology', fontsize=16, fontweight='bold')
+        
+    elif topology == 'ring':
+        # Ring topology
+        angles = np.linspace(0, 2*np.pi, 7)[:-1]  # 6 nodes
+        radius = 2.5
+        positions = []
+        
+        for i, angle in enumerate(angles):
+            x = radius * np.cos(angle)
+            y = radius * np.sin(angle)
+            positions.append((x, y))
+            plt.scatter(x, y, s=400, c='lightcoral', edgecolors='black', linewidth=2)
+            plt.text(x, y, chr(65+i), ha='center', va='center', fontweight='bold', fontsize=12)
+        
+        # Connect nodes in ring
+        for i in range(len(positions)):
+            x1, y1 = positions[i]
+            x2, y2 = positions[(i+1) % len(positions)]
+            plt.plot([x1, x2], [y1, y2], 'k-', linewidth=2)
+            
+            # Add direction arrow
+            mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
+            dx, dy = x2 - x1, y2 - y1
+            plt.arrow(mid_x - dx*0.1, mid_y - dy*0.1, dx*0.2, dy*0.2, 
+                     head_width=0.15, head_length=0.1, fc='red', ec='red')
+        
+        plt.title('Ring Network Topology', fontsize=16, fontweight='bold')
+    
+    plt.axis('equal')
+    plt.axis('off')
+    plt.tight_layout()
 
 @app.route('/network_topology/<topology>')
 def network_topology(topology):
     """Generate network topology diagrams"""
     try:
-        plt.figure(figsize=(10, 8))
-        
-        if topology == 'star':
-            # Central hub
-            plt.scatter(0, 0, s=1000, c='gold', marker='*', edgecolors='black', linewidth=2, label='Hub')
-            plt.text(0, 0, 'HUB', ha='center', va='center', fontweight='bold')
-            
-            # Surrounding nodes
-            angles = np.linspace(0, 2*np.pi, 7)[:-1]  # 6 nodes
-            radius = 3
-            for i, angle in enumerate(angles):
-                x = radius * np.cos(angle)
-                y = radius * np.sin(angle)
-                plt.scatter(x, y, s=400, c='lightblue', edgecolors='black', linewidth=2)
-                plt.plot([0, x], [0, y], 'k-', linewidth=2, alpha=0.7)
-                plt.text(x, y, f'PC{i+1}', ha='center', va='center', fontweight='bold', fontsize=10)
-            
-            plt.title('Star Network Topology', fontsize=16, fontweight='bold')
-            
-        elif topology == 'mesh':
-            # Mesh topology - all nodes connected to all
-            positions = [(0, 2), (2, 1), (2, -1), (0, -2), (-2, -1), (-2, 1)]
-            
-            # Draw all connections
-            for i, pos1 in enumerate(positions):
-                for j, pos2 in enumerate(positions[i+1:], i+1):
-                    plt.plot([pos1[0], pos2[0]], [pos1[1], pos2[1]], 'k-', linewidth=1, alpha=0.5)
-            
-            # Draw nodes
-            for i, (x, y) in enumerate(positions):
-                plt.scatter(x, y, s=400, c='lightgreen', edgecolors='black', linewidth=2)
-                plt.text(x, y, chr(65+i), ha='center', va='center', fontweight='bold', fontsize=12)
-            
-            plt.title('Mesh Network Topology', fontsize=16, fontweight='bold')
-            
-        elif topology == 'ring':
-            # Ring topology
-            angles = np.linspace(0, 2*np.pi, 7)[:-1]  # 6 nodes
-            radius = 2.5
-            positions = []
-            
-            for i, angle in enumerate(angles):
-                x = radius * np.cos(angle)
-                y = radius * np.sin(angle)
-                positions.append((x, y))
-                plt.scatter(x, y, s=400, c='lightcoral', edgecolors='black', linewidth=2)
-                plt.text(x, y, chr(65+i), ha='center', va='center', fontweight='bold', fontsize=12)
-            
-            # Connect nodes in ring
-            for i in range(len(positions)):
-                x1, y1 = positions[i]
-                x2, y2 = positions[(i+1) % len(positions)]
-                plt.plot([x1, x2], [y1, y2], 'k-', linewidth=2)
-                
-                # Add direction arrow
-                mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-                dx, dy = x2 - x1, y2 - y1
-                plt.arrow(mid_x - dx*0.1, mid_y - dy*0.1, dx*0.2, dy*0.2, 
-                         head_width=0.15, head_length=0.1, fc='red', ec='red')
-            
-            plt.title('Ring Network Topology', fontsize=16, fontweight='bold')
-        
-        plt.axis('equal')
-        plt.axis('off')
-        plt.tight_layout()
-        
-        # Convert plot to base64
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close()
-        
-        return jsonify({
-            'success': True,
-            'plot': img_base64
-        })
+        plot_b64 = render_plot(_draw_network_topology, topology)
+        return plot_response(plot_b64)
         
     except Exception as e:
-        return jsonify({
+        return fast_jsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
     print("🚀 Starting Enhanced Telecommunications Laboratory Server")
@@ -14,11 +14,15 @@ Author: Enhanced Telecommunications Laboratory
 Date: August 2025
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, send_from_directory, abort, url_for
+import functools
+import hashlib
+import itertools
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for web server
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import seaborn as sns
 import pandas as pd
 import io
@@ -26,9 +30,18 @@ import base64
 from datetime import datetime
 import json
 import os
+import tempfile
+import threading
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional JIT for the scipy-less numeric fallbacks
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Try to import scipy, if not available use approximations
 try:
     from scipy.special import erfc
@@ -47,11 +60,35 @@ except ImportError:
         a6, a7, a8, a9 = 0.27886807, -1.13520398, 1.48851587, -0.82215223
         a10 = 0.17087277
         
-        erfcx = t * np.exp(-z*z + a1*t + a2*t**2 + a3*t**3 + a4*t**4 + a5*t**5 + 
-                          a6*t**6 + a7*t**7 + a8*t**8 + a9*t**9 + a10*t**10)
+        # Horner form of the Numerical Recipes erfc fit (a1 is the constant term)
+        poly = a1 + t*(a2 + t*(a3 + t*(a4 + t*(a5 + t*(a6 + t*(a7 + t*(a8 + t*(a9 + t*a10))))))))
+        erfcx = t * np.exp(-z*z + poly)
         
         return np.where(x >= 0, erfcx, 2.0 - erfcx)
 
+if NUMBA_AVAILABLE and not SCIPY_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _erfc_scalar_nb(x):
+        """Scalar form of the erfc approximation above"""
+        z = abs(x)
+        t = 1.0 / (1.0 + 0.5 * z)
+        poly = -1.26551223 + t*(1.00002368 + t*(0.37409196 + t*(0.09678418 + t*(-0.18628806 +
+               t*(0.27886807 + t*(-1.13520398 + t*(1.48851587 + t*(-0.82215223 + t*0.17087277))))))))
+        erfcx = t * np.exp(-z*z + poly)
+        return erfcx if x >= 0 else 2.0 - erfcx
+    
+    @njit(cache=True, fastmath=True)
+    def _erfc_nb(x):
+        out = np.empty_like(x)
+        for k in range(x.shape[0]):
+            out[k] = _erfc_scalar_nb(x[k])
+        return out
+    
+    def erfc(x):
+        """Numba-compiled drop-in for the NumPy erfc approximation"""
+        x = np.asarray(x, dtype=np.float64)
+        return _erfc_nb(x.ravel()).reshape(x.shape)
+
 # Configure matplotlib for web use
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
@@ -65,6 +102,111 @@ plt.rcParams.update({
     'legend.fontsize': 10
 })
 
+# Figure pool: one reusable (fig, axes) per subplot layout instead of a new
+# figure per request. pyplot is not thread-safe, so plotting methods hold
+# _FIG_POOL_LOCK (via @pyplot_locked) while they draw and encode.
+_FIG_POOL = {}
+_FIG_POOL_LOCK = threading.RLock()
+_SUBPLOT_DEFAULTS = {k: plt.rcParams[f'figure.subplot.{k}']
+                     for k in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')}
+
+def pyplot_locked(func):
+    """Run a plotting function while holding the figure pool lock"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _FIG_POOL_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+def pooled_subplots(nrows, ncols, figsize):
+    """Cleared (fig, axes) for this layout from the pool; call under pyplot_locked"""
+    key = (nrows, ncols, figsize)
+    if key not in _FIG_POOL:
+        _FIG_POOL[key] = plt.subplots(nrows, ncols, figsize=figsize)
+    else:
+        fig, _ = _FIG_POOL[key]
+        for ax in fig.axes:
+            ax.cla()
+        fig.subplots_adjust(**_SUBPLOT_DEFAULTS)  # Undo any previous tight_layout
+    return _FIG_POOL[key]
+
+# Theoretical BER curves for the performance plot, computed once at import
+_SNR_RANGE = np.linspace(0, 25, 26)
+_SNR_LIN = 10**(_SNR_RANGE/10)
+def _compute_bers(snr_lin):
+    """Theoretical BPSK, QPSK and 16-QAM BER over a linear SNR sweep, floored at 1e-12"""
+    # erfc tails underflow towards 0 at high SNR; that is expected, not an error
+    with np.errstate(under='ignore', divide='ignore'):
+        ber_bpsk = np.maximum(0.5 * erfc(np.sqrt(snr_lin)), 1e-12)
+        ber_16qam = np.maximum((3/8) * erfc(np.sqrt(snr_lin / 10)), 1e-12)  # Gray-coded approximation
+    return ber_bpsk, ber_bpsk, ber_16qam  # QPSK same as BPSK for Gray coding
+
+if NUMBA_AVAILABLE and not SCIPY_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _compute_bers(snr_lin):
+        ber_bpsk = np.empty_like(snr_lin)
+        ber_16qam = np.empty_like(snr_lin)
+        for k in range(snr_lin.shape[0]):
+            ber_bpsk[k] = max(0.5 * _erfc_scalar_nb(np.sqrt(snr_lin[k])), 1e-12)
+            ber_16qam[k] = max((3/8) * _erfc_scalar_nb(np.sqrt(snr_lin[k] / 10)), 1e-12)
+        return ber_bpsk, ber_bpsk, ber_16qam
+    
+    erfc(np.zeros(1))  # Warm the array entry point; _compute_bers is warmed below
+
+_BER_BPSK, _BER_QPSK, _BER_16QAM = _compute_bers(_SNR_LIN)
+
+# Fixed constellation coordinates (I/Q arrays)
+_BPSK_I = np.array([-1, 1])
+_BPSK_Q = np.zeros(2)
+_QPSK_I = np.array([1, -1, -1, 1]) / np.sqrt(2)
+_QPSK_Q = np.array([1, 1, -1, -1]) / np.sqrt(2)
+_BPSK_LABELS = ('0', '1')
+_QPSK_LABELS = ('00', '01', '11', '10')
+_QAM16_I, _QAM16_Q = (g.ravel() for g in np.meshgrid([-3, -1, 1, 3], [-3, -1, 1, 3], indexing='ij'))
+
+# Network topology layouts: node positions and edges as (start, end) point pairs.
+# Edges are drawn as one LineCollection per topology at zorder 2 (Line2D's
+# default) so they stay above the node circles.
+_TOPO_HUB = (5, 4)
+_TOPO_POS = {
+    'star': ((3, 6), (7, 6), (2, 4), (8, 4), (3, 2), (7, 2)),
+    'mesh': ((3, 6), (7, 6), (2, 3), (8, 3), (5, 1)),
+    # 5 nodes on a radius-2 circle around (5, 4)
+    'ring': tuple((5 + 2 * np.cos(a), 4 + 2 * np.sin(a)) for a in np.linspace(0, 2*np.pi, 6)[:-1]),
+}
+_TOPO_EDGES = {
+    'star': tuple((_TOPO_HUB, pos) for pos in _TOPO_POS['star']),
+    'mesh': tuple(itertools.combinations(_TOPO_POS['mesh'], 2)),
+    'ring': tuple(zip(_TOPO_POS['ring'], _TOPO_POS['ring'][1:] + _TOPO_POS['ring'][:1])),
+}
+
+# Samples drawn per trace in the signal analysis plot
+PLOT_SAMPLES = 1000
+
+@functools.lru_cache(maxsize=8)
+def _time_carriers(N, sps, limit):
+    """First limit samples of the time vector and 1 MHz I/Q carriers for N symbols;
+    shared read-only float32 arrays"""
+    # Same grid as np.linspace(0, N * 1e-6, N * sps), but only the window that is used
+    # is built and cached, so a large N doesn't pin full-length arrays
+    num = N * sps
+    t = np.arange(limit, dtype=np.float64) * (N * 1e-6 / (num - 1))
+    if limit == num:
+        t[-1] = N * 1e-6
+    
+    # Phase is evaluated in float64 and only the samples are stored as float32
+    phase = 2 * np.pi * 1e6 * t
+    t, carrier, carrier_q = (arr.astype(np.float32) for arr in (t, np.cos(phase), -np.sin(phase)))
+    for arr in (t, carrier, carrier_q):
+        arr.setflags(write=False)
+    return t, carrier, carrier_q
+
+def _modulate(symbols, carrier, sps):
+    """Hold each symbol for sps samples and mix onto the carrier, via a (n, sps) view"""
+    n = len(symbols)
+    symbols = np.asarray(symbols, dtype=carrier.dtype)
+    return (carrier[:n * sps].reshape(n, sps) * symbols[:, None]).ravel()
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'telecom_lab_2025'
 
@@ -83,117 +225,131 @@ class WebTelecomLab:
         self.noise_power = 0.1
         self.modulation = 'BPSK'
         self.signal_df = pd.DataFrame()
+        self.bits = np.zeros(0, dtype=np.int64)
         self.performance_df = pd.DataFrame()
         
-    def generate_signals(self, N=None, modulation=None, noise_level=None):
-        """Generate telecommunication signals for web display"""
-        if N: self.N = N
-        if modulation: self.modulation = modulation
-        if noise_level: self.noise_power = noise_level
+    def generate_signals(self, N=None, modulation=None, noise_level=None, plot_samples=None):
+        """Generate telecommunication signals for web display (only the first plot_samples, if given)"""
+        # Work from locals; the lab attributes only record the last request for lab_status
+        N = N or self.N
+        modulation = modulation or self.modulation
+        noise_level = noise_level or self.noise_power
+        self.N, self.modulation, self.noise_power = N, modulation, noise_level
         
-        # Time vector
-        t = np.linspace(0, self.N * 1e-6, self.N * self.sps)
+        # Time vector and carriers, built only up to the last whole symbol that is kept
+        n_total = N * self.sps
+        limit = n_total if plot_samples is None else min(plot_samples, n_total)
+        limit_symbols = -(-limit // self.sps)
+        t, carrier, carrier_q = _time_carriers(N, self.sps, min(limit_symbols * self.sps, n_total))
         
         # Generate bits
-        np.random.seed(42)  # Reproducible results
-        bits = np.random.randint(0, 2, self.N)
-        
-        # Carrier signal
-        carrier = np.cos(2 * np.pi * 1e6 * t)
+        rng = np.random.default_rng(42)  # Per-request generator for reproducibility
+        bits = rng.integers(0, 2, N)
         
         # Generate modulated signal based on scheme
-        if self.modulation == 'BPSK':
+        if modulation == 'BPSK':
             symbols = 2 * bits - 1
-            baseband = np.repeat(symbols, self.sps)
-            modulated = baseband[:len(carrier)] * carrier
+            total_samples = min(n_total, len(symbols) * self.sps)
+            modulated = _modulate(symbols[:limit_symbols], carrier, self.sps)[:limit]
             
-        elif self.modulation == 'QPSK':
+        elif modulation == 'QPSK':
             # Pad bits if necessary
-            bits_padded = np.pad(bits, (0, len(bits) % 2), 'constant')
+            pad_len = (-len(bits)) % 2
+            bits_padded = bits if pad_len == 0 else np.pad(bits, (0, pad_len), 'constant')
             bits_pairs = bits_padded.reshape(-1, 2)
             
             i_symbols = 2 * bits_pairs[:, 0] - 1
             q_symbols = 2 * bits_pairs[:, 1] - 1
             
-            i_baseband = np.repeat(i_symbols, self.sps)
-            q_baseband = np.repeat(q_symbols, self.sps)
-            
-            min_len = min(len(i_baseband), len(carrier))
-            carrier_q = -np.sin(2 * np.pi * 1e6 * t[:min_len])
-            
-            modulated = (i_baseband[:min_len] * carrier[:min_len] + 
-                        q_baseband[:min_len] * carrier_q)
+            total_samples = min(n_total, len(i_symbols) * self.sps)
+            modulated = (_modulate(i_symbols[:limit_symbols], carrier, self.sps) + 
+                        _modulate(q_symbols[:limit_symbols], carrier_q, self.sps))[:limit]
         
-        elif self.modulation == '16-QAM':
+        elif modulation == '16-QAM':
             # Simplified 16-QAM
-            bits_padded = np.pad(bits, (0, (4 - len(bits) % 4) % 4), 'constant')
+            pad_len = (-len(bits)) % 4
+            bits_padded = bits if pad_len == 0 else np.pad(bits, (0, pad_len), 'constant')
             bits_4 = bits_padded.reshape(-1, 4)
             
             # Simple mapping to constellation points
-            i_symbols = []
-            q_symbols = []
-            for b in bits_4:
-                val = b[0]*8 + b[1]*4 + b[2]*2 + b[3]
-                i_symbols.append(((val % 4) - 1.5) * 2)
-                q_symbols.append(((val // 4) - 1.5) * 2)
-            
-            i_baseband = np.repeat(i_symbols, self.sps)
-            q_baseband = np.repeat(q_symbols, self.sps)
-            
-            min_len = min(len(i_baseband), len(carrier))
-            carrier_q = -np.sin(2 * np.pi * 1e6 * t[:min_len])
+            val = bits_4 @ np.array([8, 4, 2, 1])
+            i_symbols = ((val & 3) - 1.5) * 2
+            q_symbols = ((val >> 2) - 1.5) * 2
             
-            modulated = (i_baseband[:min_len] * carrier[:min_len] + 
-                        q_baseband[:min_len] * carrier_q)
+            total_samples = min(n_total, len(i_symbols) * self.sps)
+            modulated = (_modulate(i_symbols[:limit_symbols], carrier, self.sps) + 
+                        _modulate(q_symbols[:limit_symbols], carrier_q, self.sps))[:limit]
         
         # Add noise
-        noise = self.noise_power * np.random.randn(len(modulated))
+        noise = noise_level * rng.standard_normal(len(modulated), dtype=np.float32)
         received = modulated + noise
         
-        # Store in DataFrame
+        # Store in DataFrame; bits are kept per bit, not expanded per sample
         min_samples = min(len(t), len(bits) * self.sps, len(modulated))
+        self.bits = bits
         
-        self.signal_df = pd.DataFrame({
-            'time': t[:min_samples],
-            'bits': np.repeat(bits, self.sps)[:min_samples],
-            'carrier': carrier[:min_samples],
-            'modulated': modulated[:min_samples],
-            'received': received[:min_samples]
-        })
+        # One column-major float buffer -> a single contiguous pandas block
+        buf = np.empty((min_samples, 4), dtype=np.float32, order='F')
+        buf[:, 0] = t[:min_samples]
+        buf[:, 1] = carrier[:min_samples]
+        buf[:, 2] = modulated[:min_samples]
+        buf[:, 3] = received[:min_samples]
+        self.signal_df = pd.DataFrame(buf, columns=['time', 'carrier', 'modulated', 'received'],
+                                      copy=False)
         
         return {
             'bits': bits.tolist(),
-            'modulation': self.modulation,
-            'samples': min_samples,
-            'snr_db': 10 * np.log10(np.var(modulated) / (np.var(noise) + 1e-10))
+            'modulation': modulation,
+            'samples': total_samples,
+            'snr_db': 10 * np.log10(np.var(modulated, dtype=np.float64) / (np.var(noise, dtype=np.float64) + 1e-10))
         }
     
-    def plot_to_base64(self, fig):
-        """Convert matplotlib figure to base64 string for web display"""
+    def plot_to_png(self, fig):
+        """Render matplotlib figure to raw PNG bytes"""
         img_buffer = io.BytesIO()
-        fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight', 
+        # 90 dpi is plenty for on-screen display; the figure is saved at its
+        # own size rather than bbox_inches='tight', which costs a second draw
+        fig.savefig(img_buffer, format='png', dpi=90, 
                    facecolor='white', edgecolor='none')
-        img_buffer.seek(0)
-        img_b64 = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close(fig)
-        return img_b64
+        return img_buffer.getvalue()
+    
+    def plot_to_base64(self, fig):
+        """Convert matplotlib figure to base64 string for web display"""
+        return base64.b64encode(self.plot_to_png(fig)).decode()
+    
+    def plot_to_svg(self, fig):
+        """Render matplotlib figure to an SVG document string (vector, no rasterisation)"""
+        img_buffer = io.StringIO()
+        fig.savefig(img_buffer, format='svg', facecolor='white', edgecolor='none')
+        return img_buffer.getvalue()
+    
+    def encode_plot(self, fig, fmt='base64'):
+        """Encode a figure as base64 PNG (default), raw 'png' bytes or an 'svg' string"""
+        if fmt == 'png':
+            return self.plot_to_png(fig)
+        if fmt == 'svg':
+            return self.plot_to_svg(fig)
+        return self.plot_to_base64(fig)
     
+    @pyplot_locked
     def generate_signal_plot(self):
         """Generate signal analysis plot for web display"""
         if self.signal_df.empty:
-            self.generate_signals()
+            self.generate_signals(plot_samples=PLOT_SAMPLES)
         
-        fig, axes = plt.subplots(4, 1, figsize=(14, 12))
+        fig, axes = pooled_subplots(4, 1, (14, 12))
         fig.suptitle(f'{self.modulation} Signal Analysis', fontsize=16, fontweight='bold')
         
         # Limit samples for web display
-        plot_samples = 1000
+        plot_samples = PLOT_SAMPLES
         time_data = self.signal_df['time'][:plot_samples]
         
-        # Digital bits
-        axes[0].plot(time_data, self.signal_df['bits'][:plot_samples], 
-                    'b-', linewidth=2, label='Digital Bits')
-        axes[0].fill_between(time_data, 0, self.signal_df['bits'][:plot_samples], 
+        # Digital bits, drawn as steps at each bit boundary (plus the window end)
+        n_bits = -(-len(time_data) // self.sps)
+        bit_times = np.append(time_data.to_numpy()[::self.sps], time_data.iloc[-1])
+        bit_levels = np.append(self.bits[:n_bits], self.bits[n_bits - 1])
+        axes[0].step(bit_times, bit_levels, 'b-', where='post', linewidth=2, label='Digital Bits')
+        axes[0].fill_between(bit_times, 0, bit_levels, step='post', 
                            alpha=0.3, color='blue')
         axes[0].set_title('Digital Bit Stream')
         axes[0].set_ylabel('Amplitude')
@@ -225,48 +381,42 @@ class WebTelecomLab:
         axes[3].grid(True, alpha=0.3)
         axes[3].legend()
         
-        plt.tight_layout()
+        fig.tight_layout()
         return self.plot_to_base64(fig)
     
-    def generate_constellation_plot(self, modulation=None):
+    def generate_constellation_plot(self, modulation=None, fmt='base64'):
         """Generate constellation diagram for web display"""
-        if modulation:
-            self.modulation = modulation
-            
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
+        # Read-only on lab state: a concurrent /generate_signals owns self.modulation
+        return self._constellation_plot(modulation or self.modulation, fmt)
+    
+    @functools.lru_cache(maxsize=32)
+    @pyplot_locked
+    def _constellation_plot(self, modulation, fmt='base64'):
+        """Render (once per modulation) the constellation diagram as base64 PNG"""
+        fig, ax = pooled_subplots(1, 1, (10, 8))
         ax.set_aspect('equal')
         
-        if self.modulation == 'BPSK':
-            points = np.array([-1, 1])
-            ax.scatter(points, [0, 0], s=300, c=['red', 'blue'], 
+        if modulation == 'BPSK':
+            ax.scatter(_BPSK_I, _BPSK_Q, s=300, c=['red', 'blue'], 
                       alpha=0.8, edgecolors='black', linewidth=2)
-            ax.text(-1, -0.3, '0', ha='center', fontsize=12, fontweight='bold')
-            ax.text(1, -0.3, '1', ha='center', fontsize=12, fontweight='bold')
+            for i, q, label in zip(_BPSK_I, _BPSK_Q - 0.3, _BPSK_LABELS):
+                ax.text(i, q, label, ha='center', fontsize=12, fontweight='bold')
             ax.set_xlim(-2, 2)
             ax.set_ylim(-2, 2)
             ax.set_title('BPSK Constellation\n1 bit per symbol', fontsize=16, fontweight='bold')
             
-        elif self.modulation == 'QPSK':
-            i_points = np.array([1, -1, -1, 1]) / np.sqrt(2)
-            q_points = np.array([1, 1, -1, -1]) / np.sqrt(2)
+        elif modulation == 'QPSK':
             colors = ['red', 'blue', 'green', 'orange']
-            ax.scatter(i_points, q_points, s=300, c=colors, alpha=0.8, 
+            ax.scatter(_QPSK_I, _QPSK_Q, s=300, c=colors, alpha=0.8, 
                       edgecolors='black', linewidth=2)
-            labels = ['00', '01', '11', '10']
-            for i, q, label in zip(i_points, q_points, labels):
-                ax.text(i, q-0.2, label, ha='center', fontsize=12, fontweight='bold')
+            for i, q, label in zip(_QPSK_I, _QPSK_Q - 0.2, _QPSK_LABELS):
+                ax.text(i, q, label, ha='center', fontsize=12, fontweight='bold')
             ax.set_xlim(-1.5, 1.5)
             ax.set_ylim(-1.5, 1.5)
             ax.set_title('QPSK Constellation\n2 bits per symbol', fontsize=16, fontweight='bold')
             
-        elif self.modulation == '16-QAM':
-            i_points = []
-            q_points = []
-            for i in [-3, -1, 1, 3]:
-                for q in [-3, -1, 1, 3]:
-                    i_points.append(i)
-                    q_points.append(q)
-            ax.scatter(i_points, q_points, s=200, c='purple', alpha=0.8, 
+        elif modulation == '16-QAM':
+            ax.scatter(_QAM16_I, _QAM16_Q, s=200, c='purple', alpha=0.8, 
                       edgecolors='black', linewidth=2)
             ax.set_xlim(-5, 5)
             ax.set_ylim(-5, 5)
@@ -278,70 +428,39 @@ class WebTelecomLab:
         ax.axhline(y=0, color='k', linestyle='-', alpha=0.5)
         ax.axvline(x=0, color='k', linestyle='-', alpha=0.5)
         
-        return self.plot_to_base64(fig)
+        return self.encode_plot(fig, fmt)
     
-    def generate_performance_plot(self):
-        """Generate BER vs SNR performance plot with improved error handling"""
-        try:
-            snr_range = np.linspace(0, 25, 26)
-            snr_linear = 10**(snr_range/10)
-            
-            # More robust BER calculations with error handling
-            try:
-                # Theoretical BER curves using erfc
-                ber_bpsk = 0.5 * erfc(np.sqrt(snr_linear))
-                ber_qpsk = 0.5 * erfc(np.sqrt(snr_linear))  # Same as BPSK for Gray coding
-                ber_16qam = (3/8) * erfc(np.sqrt((4/5) * snr_linear))  # Approximation
-            except Exception as e:
-                print(f"Error calculating BER: {e}")
-                # Fallback to simpler approximations
-                ber_bpsk = np.exp(-snr_linear/2) / 2
-                ber_qpsk = np.exp(-snr_linear/2) / 2
-                ber_16qam = np.exp(-snr_linear/4)
-            
-            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-            
-            # Plot with error handling
-            try:
-                ax.semilogy(snr_range, np.maximum(ber_bpsk, 1e-12), 'b-o', linewidth=2, 
-                           markersize=6, label='BPSK')
-                ax.semilogy(snr_range, np.maximum(ber_qpsk, 1e-12), 'g-s', linewidth=2, 
-                           markersize=6, label='QPSK')
-                ax.semilogy(snr_range, np.maximum(ber_16qam, 1e-12), 'r-^', linewidth=2, 
-                           markersize=6, label='16-QAM')
-            except Exception as e:
-                print(f"Error plotting BER curves: {e}")
-                # Simple fallback plot
-                ax.plot(snr_range, ber_bpsk, 'b-', label='BPSK')
-                ax.plot(snr_range, ber_qpsk, 'g-', label='QPSK')
-                ax.plot(snr_range, ber_16qam, 'r-', label='16-QAM')
-                ax.set_yscale('log')
-            
-            ax.set_title('Bit Error Rate vs Signal-to-Noise Ratio', fontsize=16, fontweight='bold')
-            ax.set_xlabel('SNR (dB)')
-            ax.set_ylabel('Bit Error Rate (BER)')
-            ax.grid(True, alpha=0.3)
-            ax.legend(fontsize=12)
-            ax.set_ylim(1e-12, 1)
-            
-            return self.plot_to_base64(fig)
-            
-        except Exception as e:
-            print(f"Error generating performance plot: {e}")
-            # Return a simple error plot
-            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-            ax.text(0.5, 0.5, 'Performance analysis temporarily unavailable\nPlease try again later', 
-                   ha='center', va='center', transform=ax.transAxes, fontsize=14)
-            ax.set_title('Performance Analysis', fontsize=16, fontweight='bold')
-            return self.plot_to_base64(fig)
+    @functools.lru_cache(maxsize=32)
+    @pyplot_locked
+    def generate_performance_plot(self, fmt='base64'):
+        """Generate BER vs SNR performance plot; errors propagate so a failure is never cached"""
+        fig, ax = pooled_subplots(1, 1, (12, 8))
+        
+        ax.semilogy(_SNR_RANGE, _BER_BPSK, 'b-o', linewidth=2, 
+                   markersize=6, label='BPSK')
+        ax.semilogy(_SNR_RANGE, _BER_QPSK, 'g-s', linewidth=2, 
+                   markersize=6, label='QPSK')
+        ax.semilogy(_SNR_RANGE, _BER_16QAM, 'r-^', linewidth=2, 
+                   markersize=6, label='16-QAM')
+        
+        ax.set_title('Bit Error Rate vs Signal-to-Noise Ratio', fontsize=16, fontweight='bold')
+        ax.set_xlabel('SNR (dB)')
+        ax.set_ylabel('Bit Error Rate (BER)')
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize=12)
+        ax.set_ylim(1e-12, 1)
+        
+        return self.encode_plot(fig, fmt)
     
-    def generate_5g_comparison_plot(self):
+    @functools.lru_cache(maxsize=32)
+    @pyplot_locked
+    def generate_5g_comparison_plot(self, fmt='base64'):
         """Generate 5G technology comparison plot"""
         technologies = ['4G LTE', '5G Sub-6', '5G mmWave', '6G Future']
         peak_throughput = [1, 10, 50, 1000]  # Gbps
         latency = [10, 1, 0.1, 0.01]  # ms
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        fig, (ax1, ax2) = pooled_subplots(1, 2, (16, 8))
         
         # Throughput comparison
         bars1 = ax1.bar(technologies, peak_throughput, 
@@ -352,10 +471,8 @@ class WebTelecomLab:
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Add value labels
-        for bar, value in zip(bars1, peak_throughput):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height * 1.1,
-                    f'{value} Gbps', ha='center', va='bottom', fontweight='bold')
+        ax1.bar_label(bars1, labels=[f'{v} Gbps' for v in peak_throughput], 
+                     padding=3, fontweight='bold')
         
         # Latency comparison
         bars2 = ax2.bar(technologies, latency, 
@@ -366,17 +483,107 @@ class WebTelecomLab:
         ax2.grid(True, alpha=0.3, axis='y')
         
         # Add value labels
-        for bar, value in zip(bars2, latency):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height * 1.1,
-                    f'{value} ms', ha='center', va='bottom', fontweight='bold')
+        ax2.bar_label(bars2, labels=[f'{v} ms' for v in latency], 
+                     padding=3, fontweight='bold')
         
-        plt.tight_layout()
-        return self.plot_to_base64(fig)
+        fig.tight_layout()
+        return self.encode_plot(fig, fmt)
+
+    @functools.lru_cache(maxsize=32)
+    @pyplot_locked
+    def generate_topology_plot(self, topology, fmt='base64'):
+        """Generate network topology visualization for web display"""
+        fig, ax = pooled_subplots(1, 1, (10, 8))
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 8)
+        ax.set_aspect('equal')
+        
+        if topology == 'star':
+            # Central hub
+            hub = plt.Circle(_TOPO_HUB, 0.4, color='yellow', ec='black')
+            ax.add_patch(hub)
+            ax.text(*_TOPO_HUB, 'Hub', ha='center', va='center', fontweight='bold')
+            
+            # Connected nodes
+            for i, pos in enumerate(_TOPO_POS['star'], 1):
+                circle = plt.Circle(pos, 0.3, color='lightblue', ec='black')
+                ax.add_patch(circle)
+                ax.text(pos[0], pos[1], str(i), ha='center', va='center', fontweight='bold')
+            ax.add_collection(LineCollection(_TOPO_EDGES['star'], colors='k', linewidths=2, zorder=2))
+            
+            ax.set_title('Star Topology - Centralized Architecture', fontsize=16, fontweight='bold')
+            
+        elif topology == 'mesh':
+            for i, pos in enumerate(_TOPO_POS['mesh'], 1):
+                circle = plt.Circle(pos, 0.3, color='lightgreen', ec='black')
+                ax.add_patch(circle)
+                ax.text(pos[0], pos[1], str(i), ha='center', va='center', fontweight='bold')
+            
+            # Connect all nodes
+            ax.add_collection(LineCollection(_TOPO_EDGES['mesh'], colors='k', linewidths=1.5, alpha=0.7, zorder=2))
+            
+            ax.set_title('Mesh Topology - Fully Connected Network', fontsize=16, fontweight='bold')
+        
+        elif topology == 'ring':
+            for i, pos in enumerate(_TOPO_POS['ring'], 1):
+                circle = plt.Circle(pos, 0.3, color='lightcoral', ec='black')
+                ax.add_patch(circle)
+                ax.text(pos[0], pos[1], str(i), ha='center', va='center', fontweight='bold')
+            
+            # Connect in ring
+            ax.add_collection(LineCollection(_TOPO_EDGES['ring'], colors='k', linewidths=2, zorder=2))
+            
+            ax.set_title('Ring Topology - Circular Network', fontsize=16, fontweight='bold')
+        
+        ax.axis('off')
+        fig.tight_layout()
+        return self.encode_plot(fig, fmt)
 
 # Initialize global lab instance
 telecom_lab = WebTelecomLab()
 
+@functools.lru_cache(maxsize=64)
+def _plot_etag(plot):
+    """Strong ETag for a cached plot (base64 string or PNG bytes)"""
+    return hashlib.sha1(plot.encode() if isinstance(plot, str) else plot).hexdigest()
+
+def cached_plot_response(plot, plot_key='plot', **fields):
+    """JSON plot response tagged with an ETag; answers 304 on a matching If-None-Match"""
+    etag = _plot_etag(plot)
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify({'success': True, plot_key: plot, **fields})
+    response.set_etag(etag)
+    return response
+
+# Rendered-once SVGs for the fixed diagrams, written under static/plots
+PLOT_DIR = os.path.join(app.static_folder, 'plots')
+TOPOLOGIES = ('star', 'mesh', 'ring')
+_SOURCE_MTIME = os.path.getmtime(__file__)  # Files older than this module are re-rendered
+
+def static_svg_response(name, render):
+    """Serve static/plots/<name>.svg, rendering it with render() on first use"""
+    filename = f'{name}.svg'
+    path = os.path.join(PLOT_DIR, filename)
+    if not os.path.exists(path) or os.path.getmtime(path) < _SOURCE_MTIME:
+        os.makedirs(PLOT_DIR, exist_ok=True)
+        # Unique temp file per writer; concurrent first hits each replace atomically
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=PLOT_DIR)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(render())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return send_from_directory(PLOT_DIR, filename, mimetype='image/svg+xml')
+
+def png_response(png):
+    """Serve cached PNG bytes directly as image/png, skipping base64 and JSON"""
+    return send_file(io.BytesIO(png), mimetype='image/png', etag=_plot_etag(png))
+
 @app.route('/')
 def index():
     """Main page with telecommunications laboratory interface"""
@@ -392,8 +599,11 @@ def generate_signals():
         modulation = data.get('modulation', 'BPSK')
         noise_level = data.get('noise_level', 0.1)
         
-        result = telecom_lab.generate_signals(N, modulation, noise_level)
-        plot_b64 = telecom_lab.generate_signal_plot()
+        # Hold the pool lock across both steps so another request can't swap the lab's
+        # bits/signal_df (or modulation) between generating and plotting
+        with _FIG_POOL_LOCK:
+            result = telecom_lab.generate_signals(N, modulation, noise_level, plot_samples=PLOT_SAMPLES)
+            plot_b64 = telecom_lab.generate_signal_plot()
         
         return jsonify({
             'success': True,
@@ -411,12 +621,9 @@ def generate_signals():
 def constellation_diagram(modulation):
     """Generate constellation diagram for specified modulation"""
     try:
-        plot_b64 = telecom_lab.generate_constellation_plot(modulation)
-        return jsonify({
-            'success': True,
-            'plot': plot_b64,
-            'modulation': modulation
-        })
+        # Sparse scatter plot: send inline SVG instead of a base64 PNG
+        plot_svg = telecom_lab.generate_constellation_plot(modulation, fmt='svg')
+        return cached_plot_response(plot_svg, plot_key='plot_svg', modulation=modulation)
     except Exception as e:
         print(f"Error in constellation_diagram: {e}")
         return jsonify({
@@ -424,15 +631,18 @@ def constellation_diagram(modulation):
             'error': str(e)
         }), 500
 
+@app.route('/constellation/<modulation>.png')
+def constellation_png(modulation):
+    """Constellation diagram as a raw PNG for direct <img> use"""
+    return png_response(telecom_lab.generate_constellation_plot(modulation, fmt='png'))
+
 @app.route('/performance_analysis')
 def performance_analysis():
     """Generate performance analysis plots"""
     try:
-        plot_b64 = telecom_lab.generate_performance_plot()
-        return jsonify({
-            'success': True,
-            'plot': plot_b64
-        })
+        # A few dozen markers and lines: send inline SVG instead of a base64 PNG
+        plot_svg = telecom_lab.generate_performance_plot(fmt='svg')
+        return cached_plot_response(plot_svg, plot_key='plot_svg')
     except Exception as e:
         print(f"Error in performance_analysis: {e}")
         return jsonify({
@@ -440,15 +650,17 @@ def performance_analysis():
             'error': str(e)
         }), 500
 
+@app.route('/performance_analysis.png')
+def performance_analysis_png():
+    """Performance analysis plot as a raw PNG for direct <img> use"""
+    return png_response(telecom_lab.generate_performance_plot(fmt='png'))
+
 @app.route('/5g_comparison')
 def g5_comparison():
     """Generate 5G technology comparison"""
     try:
-        plot_b64 = telecom_lab.generate_5g_comparison_plot()
-        return jsonify({
-            'success': True,
-            'plot': plot_b64
-        })
+        # The page loads the diagram from the static SVG file
+        return jsonify({'success': True, 'plot_url': url_for('g5_comparison_svg')})
     except Exception as e:
         print(f"Error in 5g_comparison: {e}")
         return jsonify({
@@ -456,80 +668,28 @@ def g5_comparison():
             'error': str(e)
         }), 500
 
+@app.route('/5g_comparison.png')
+def g5_comparison_png():
+    """5G technology comparison as a raw PNG for direct <img> use"""
+    return png_response(telecom_lab.generate_5g_comparison_plot(fmt='png'))
+
+@app.route('/5g_comparison.svg')
+def g5_comparison_svg():
+    """5G technology comparison as a static SVG file"""
+    return static_svg_response('5g_comparison',
+                               lambda: telecom_lab.generate_5g_comparison_plot(fmt='svg'))
+
 @app.route('/network_topology/<topology>')
 def network_topology(topology):
     """Generate network topology visualization"""
     try:
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 8)
-        ax.set_aspect('equal')
+        if topology in TOPOLOGIES:
+            # The page loads the diagram from the static SVG file
+            return jsonify({'success': True, 'topology': topology,
+                            'plot_url': url_for('network_topology_svg', topology=topology)})
         
-        if topology == 'star':
-            # Central hub
-            hub = plt.Circle((5, 4), 0.4, color='yellow', ec='black')
-            ax.add_patch(hub)
-            ax.text(5, 4, 'Hub', ha='center', va='center', fontweight='bold')
-            
-            # Connected nodes
-            positions = [(3, 6), (7, 6), (2, 4), (8, 4), (3, 2), (7, 2)]
-            for i, pos in enumerate(positions, 1):
-                circle = plt.Circle(pos, 0.3, color='lightblue', ec='black')
-                ax.add_patch(circle)
-                ax.text(pos[0], pos[1], str(i), ha='center', va='center', fontweight='bold')
-                ax.plot([5, pos[0]], [4, pos[1]], 'k-', linewidth=2)
-            
-            ax.set_title('Star Topology - Centralized Architecture', fontsize=16, fontweight='bold')
-            
-        elif topology == 'mesh':
-            # Mesh positions
-            positions = [(3, 6), (7, 6), (2, 3), (8, 3), (5, 1)]
-            for i, pos in enumerate(positions, 1):
-                circle = plt.Circle(pos, 0.3, color='lightgreen', ec='black')
-                ax.add_patch(circle)
-                ax.text(pos[0], pos[1], str(i), ha='center', va='center', fontweight='bold')
-            
-            # Connect all nodes
-            for i in range(len(positions)):
-                for j in range(i+1, len(positions)):
-                    start = positions[i]
-                    end = positions[j]
-                    ax.plot([start[0], end[0]], [start[1], end[1]], 'k-', linewidth=1.5, alpha=0.7)
-            
-            ax.set_title('Mesh Topology - Fully Connected Network', fontsize=16, fontweight='bold')
-        
-        elif topology == 'ring':
-            # Ring positions
-            angles = np.linspace(0, 2*np.pi, 6)[:-1]  # 5 nodes
-            center_x, center_y = 5, 4
-            radius = 2
-            
-            positions = []
-            for i, angle in enumerate(angles):
-                x = center_x + radius * np.cos(angle)
-                y = center_y + radius * np.sin(angle)
-                positions.append((x, y))
-                circle = plt.Circle((x, y), 0.3, color='lightcoral', ec='black')
-                ax.add_patch(circle)
-                ax.text(x, y, str(i+1), ha='center', va='center', fontweight='bold')
-            
-            # Connect in ring
-            for i in range(len(positions)):
-                start = positions[i]
-                end = positions[(i+1) % len(positions)]
-                ax.plot([start[0], end[0]], [start[1], end[1]], 'k-', linewidth=2)
-            
-            ax.set_title('Ring Topology - Circular Network', fontsize=16, fontweight='bold')
-        
-        ax.axis('off')
-        plt.tight_layout()
-        
-        plot_b64 = telecom_lab.plot_to_base64(fig)
-        return jsonify({
-            'success': True,
-            'plot': plot_b64,
-            'topology': topology
-        })
+        plot_b64 = telecom_lab.generate_topology_plot(topology)
+        return cached_plot_response(plot_b64, topology=topology)
     except Exception as e:
         print(f"Error in network_topology: {e}")
         return jsonify({
@@ -537,6 +697,19 @@ def network_topology(topology):
             'error': str(e)
         }), 500
 
+@app.route('/network_topology/<topology>.png')
+def network_topology_png(topology):
+    """Network topology visualization as a raw PNG for direct <img> use"""
+    return png_response(telecom_lab.generate_topology_plot(topology, fmt='png'))
+
+@app.route('/network_topology/<topology>.svg')
+def network_topology_svg(topology):
+    """Network topology visualization as a static SVG file"""
+    if topology not in TOPOLOGIES:
+        abort(404)
+    return static_svg_response(f'topology_{topology}',
+                               lambda: telecom_lab.generate_topology_plot(topology, fmt='svg'))
+
 @app.route('/api/lab_status')
 def lab_status():
     """Get current laboratory status and parameters"""
@@ -574,6 +747,8 @@ if __name__ == '__main__':
     print("📡 Features: Signal Analysis, Modulation, 5G Comparison")
     print(f"🔬 SciPy Available: {'Yes' if SCIPY_AVAILABLE else 'No (using approximations)'}")
     print("🔧 Access at: http://localhost:5000")
+    print("🏭 Production: gunicorn -w 4 --preload --worker-class gthread --threads 2 wsgi:app")
     print("="*60)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Debug mode (reloader + debugger) only when FLASK_DEBUG=1
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
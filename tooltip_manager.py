@@ -5,23 +5,249 @@ Utilities for managing the enhanced telecommunications tooltip system
 """
 
 import os
-import json
 import sqlite3
 import argparse
+import atexit
+import functools
 from datetime import datetime, timedelta
-import csv
+import itertools
+
+# csv, json and the optional codecs below are imported on first use so commands
+# like status, init and cleanup start without paying for them
+
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """Optional Rust JSON codec for acronym files and analytics reports, or None"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+@functools.lru_cache(maxsize=None)
+def _ijson():
+    """Optional streaming JSON parser so large acronym dumps are never held in memory, or None"""
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+# Connection tuning applied on every connect: WAL with NORMAL sync, in-memory
+# temp tables, a 64 MB page cache and a 256 MB memory map
+_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Rows handed to each executemany call during imports
+_IMPORT_BATCH = 5000
+
+_CUSTOM_ACRONYMS_DDL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        acronym TEXT PRIMARY KEY,
+        definition TEXT NOT NULL,
+        category TEXT,
+        priority TEXT DEFAULT 'medium',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    ) WITHOUT ROWID
+'''
+
+# Analytics, rollup and cleanup statements. Keeping the SQL text fixed lets the
+# shared connection's statement cache skip re-parsing on repeated calls
+_Q_POPULAR = '''
+    SELECT acronym, SUM(cnt) as interactions
+    FROM daily_acronym_counts
+    WHERE day > ?
+    GROUP BY acronym
+    ORDER BY interactions DESC
+    LIMIT 10
+'''
+
+_Q_SEARCH_STATS = '''
+    SELECT COUNT(*) as total_searches,
+           COUNT(DISTINCT query) as unique_queries
+    FROM search_queries
+    WHERE timestamp > ?
+'''
+
+_Q_DAILY = '''
+    SELECT day, SUM(cnt) as interactions
+    FROM daily_acronym_counts
+    WHERE day > ?
+    GROUP BY day
+    ORDER BY day
+'''
+
+_Q_TOTAL = '''
+    SELECT COALESCE(SUM(cnt), 0)
+    FROM daily_acronym_counts
+    WHERE day > ?
+'''
+
+_Q_ROLLUP_WATERMARK = "SELECT value FROM _meta WHERE key = 'rollup_watermark'"
+
+_Q_ROLLUP_REFRESH = '''
+    INSERT OR REPLACE INTO daily_acronym_counts (day, acronym, cnt)
+    SELECT DATE(timestamp), acronym, COUNT(*)
+    FROM tooltip_interactions
+    WHERE timestamp >= ?
+    GROUP BY 1, 2
+'''
+
+_Q_ROLLUP_LATEST_DAY = 'SELECT DATE(MAX(timestamp)) FROM tooltip_interactions'
+
+_Q_ROLLUP_SET_WATERMARK = "INSERT OR REPLACE INTO _meta (key, value) VALUES ('rollup_watermark', ?)"
+
+_Q_STATUS_COUNTS = '''
+    SELECT (SELECT COUNT(*) FROM tooltip_interactions),
+           (SELECT COUNT(*) FROM search_queries),
+           (SELECT COUNT(*) FROM custom_acronyms)
+'''
+
+_Q_CLEANUP_TI = 'DELETE FROM tooltip_interactions WHERE timestamp < ?'
+
+_Q_CLEANUP_SQ = 'DELETE FROM search_queries WHERE timestamp < ?'
+
+_Q_CLEANUP_ROLLUP = 'DELETE FROM daily_acronym_counts WHERE day <= ?'
+
+_Q_ROLLUP_RECOUNT_DAY = '''
+    INSERT INTO daily_acronym_counts (day, acronym, cnt)
+    SELECT DATE(timestamp), acronym, COUNT(*)
+    FROM tooltip_interactions
+    WHERE timestamp >= ? AND timestamp < ?
+    GROUP BY 1, 2
+'''
+
+def _loads(data):
+    """Parse JSON from bytes, using orjson when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    
+    import json
+    return json.loads(data)
+
+def _dumps(obj):
+    """Serialise to indented UTF-8 JSON bytes, using orjson when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    import json
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _contains_bytes(f, needle, chunk_size=1 << 20):
+    """Whether a binary file contains needle, scanned in fixed-size chunks"""
+    tail = b''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return False
+        if needle in tail + chunk:
+            return True
+        tail = chunk[-(len(needle) - 1):]
+
+def _iter_json_rows(f):
+    """Yield (acronym, definition, category) rows from a binary JSON acronym file"""
+    ijson = _ijson()
+    if ijson is None:
+        data = _loads(f.read())
+        acronyms = data['acronyms'] if 'acronyms' in data else data
+        for acronym, definition in acronyms.items():
+            yield acronym, definition, 'Imported'
+        return
+    
+    # A document that never spells out the key can only be a flat map: one pass
+    if not _contains_bytes(f, b'"acronyms"'):
+        f.seek(0)
+        for acronym, definition in ijson.kvitems(f, '', use_float=True):
+            yield acronym, definition, 'Imported'
+        return
+    
+    # Prefer the nested 'acronyms' map
+    f.seek(0)
+    found = False
+    for acronym, definition in ijson.kvitems(f, 'acronyms', use_float=True):
+        found = True
+        yield acronym, definition, 'Imported'
+    if found:
+        return
+    
+    # Rare: an empty nested map, or the word only appearing inside the flat map
+    f.seek(0)
+    for prefix, event, value in ijson.parse(f):
+        if prefix == '' and event == 'map_key' and value == 'acronyms':
+            return
+    
+    f.seek(0)
+    for acronym, definition in ijson.kvitems(f, '', use_float=True):
+        yield acronym, definition, 'Imported'
+
+def _iter_csv_rows(f):
+    """Yield (acronym, definition, category) rows from a CSV acronym file"""
+    import csv
+    
+    reader = csv.reader(f)
+    
+    # Resolve column positions once instead of building a dict per row
+    header = next(reader, [])
+    ai = header.index('acronym')
+    di = header.index('definition')
+    ci = header.index('category') if 'category' in header else None
+    
+    for row in reader:
+        if not row:
+            continue
+        
+        acronym = row[ai].strip().upper()
+        definition = row[di].strip()
+        category = row[ci].strip() if ci is not None else 'Imported'
+        
+        if acronym and definition:
+            yield acronym, definition, category
 
 class TooltipSystemManager:
     def __init__(self, db_path='tooltip_analytics.db'):
         self.db_path = db_path
+        self._conn = None
+        atexit.register(self.close)
         self.ensure_database()
 
+    def _get_conn(self):
+        """Return the shared autocommit connection, opening and tuning it on first use"""
+        if self._conn is None:
+            is_new = not os.path.exists(self.db_path)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            cursor = conn.cursor()
+            
+            # Incremental auto-vacuum can only be chosen before anything is written,
+            # so it goes ahead of the journal mode switch on a brand new file
+            if is_new:
+                cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            for pragma in _PRAGMAS:
+                cursor.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the shared connection if it is open"""
+        if self._conn is not None:
+            # Let SQLite refresh planner statistics for the queries this session ran
+            self._conn.execute('PRAGMA optimize')
+            self._conn.close()
+            self._conn = None
+
     def ensure_database(self):
         """Ensure the database exists and is properly structured"""
         if not os.path.exists(self.db_path):
             print(f"Creating database: {self.db_path}")
             
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         # Create tables
@@ -47,20 +273,50 @@ class TooltipSystemManager:
             )
         ''')
         
+        # Acronyms are keyed by their own text; older databases carry a surrogate id
+        # column plus a separate UNIQUE index and are migrated in place
+        cursor.execute('PRAGMA table_info(custom_acronyms)')
+        columns = [row[1] for row in cursor.fetchall()]
+        
+        if 'id' in columns:
+            print("Migrating custom_acronyms to WITHOUT ROWID")
+            with conn:
+                cursor.execute('BEGIN')
+                cursor.execute(_CUSTOM_ACRONYMS_DDL.format(table='custom_acronyms_new'))
+                cursor.execute('''
+                    INSERT INTO custom_acronyms_new
+                        (acronym, definition, category, priority, created_at, updated_at)
+                    SELECT acronym, definition, category, priority, created_at, updated_at
+                    FROM custom_acronyms
+                ''')
+                cursor.execute('DROP TABLE custom_acronyms')
+                cursor.execute('ALTER TABLE custom_acronyms_new RENAME TO custom_acronyms')
+        else:
+            cursor.execute(_CUSTOM_ACRONYMS_DDL.format(table='custom_acronyms'))
+        
+        # Indexes for the analytics range scans and cleanup deletes
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ti_ts ON tooltip_interactions(timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ti_acronym_ts ON tooltip_interactions(acronym, timestamp)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sq_ts ON search_queries(timestamp)')
+        
+        # Per-day interaction counts, refreshed incrementally by refresh_rollups()
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS custom_acronyms (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                acronym TEXT UNIQUE NOT NULL,
-                definition TEXT NOT NULL,
-                category TEXT,
-                priority TEXT DEFAULT 'medium',
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            CREATE TABLE IF NOT EXISTS daily_acronym_counts (
+                day TEXT NOT NULL,
+                acronym TEXT NOT NULL,
+                cnt INTEGER NOT NULL,
+                PRIMARY KEY (day, acronym)
+            ) WITHOUT ROWID
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS _meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
             )
         ''')
         
         conn.commit()
-        conn.close()
         print("✅ Database structure verified")
 
     def import_acronyms(self, file_path):
@@ -71,106 +327,130 @@ class TooltipSystemManager:
             print(f"❌ File not found: {file_path}")
             return
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        imported_count = 0
-        skipped_count = 0
-        
         try:
-            if file_path.endswith('.json'):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                if 'acronyms' in data:
-                    acronyms = data['acronyms']
-                else:
-                    acronyms = data
-                    
-                for acronym, definition in acronyms.items():
-                    try:
-                        cursor.execute('''
-                            INSERT INTO custom_acronyms (acronym, definition, category)
-                            VALUES (?, ?, ?)
-                        ''', (acronym, definition, 'Imported'))
-                        imported_count += 1
-                    except sqlite3.IntegrityError:
-                        skipped_count += 1
+            # One transaction for the whole import; duplicates are ignored rather than raised
+            with conn:
+                cursor.execute('BEGIN')
+                
+                if file_path.endswith('.json'):
+                    with open(file_path, 'rb') as f:
+                        seen_count, imported_count = self._insert_acronyms(cursor, _iter_json_rows(f))
                         
-            elif file_path.endswith('.csv'):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    
-                    for row in reader:
-                        acronym = row.get('acronym', '').strip().upper()
-                        definition = row.get('definition', '').strip()
-                        category = row.get('category', 'Imported').strip()
+                elif file_path.endswith('.csv'):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        seen_count, imported_count = self._insert_acronyms(cursor, _iter_csv_rows(f))
                         
-                        if acronym and definition:
-                            try:
-                                cursor.execute('''
-                                    INSERT INTO custom_acronyms (acronym, definition, category)
-                                    VALUES (?, ?, ?)
-                                ''', (acronym, definition, category))
-                                imported_count += 1
-                            except sqlite3.IntegrityError:
-                                skipped_count += 1
+                else:
+                    seen_count = imported_count = 0
+            
+            skipped_count = seen_count - imported_count
             
-            conn.commit()
+            # Fresh statistics for the newly loaded rows
+            if imported_count:
+                cursor.execute('ANALYZE')
             print(f"✅ Import completed: {imported_count} added, {skipped_count} skipped")
             
         except Exception as e:
             print(f"❌ Import error: {e}")
-        finally:
-            conn.close()
+
+    def _insert_acronyms(self, cursor, rows):
+        """Insert rows in executemany batches, returning (rows seen, rows inserted)"""
+        seen_count = 0
+        imported_count = 0
+        
+        while True:
+            batch = list(itertools.islice(rows, _IMPORT_BATCH))
+            if not batch:
+                break
+            
+            cursor.executemany('''
+                INSERT OR IGNORE INTO custom_acronyms (acronym, definition, category)
+                VALUES (?, ?, ?)
+            ''', batch)
+            seen_count += len(batch)
+            imported_count += max(cursor.rowcount, 0)
+        
+        return seen_count, imported_count
 
     def export_acronyms(self, file_path, format='json'):
         """Export all custom acronyms to file"""
         print(f"📤 Exporting acronyms to: {file_path}")
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT acronym, definition, category FROM custom_acronyms ORDER BY acronym')
-        rows = cursor.fetchall()
+        exported_count = 0
         
         try:
             if format.lower() == 'json':
+                # One ordered pass over the cursor fills both maps without fetchall()
+                acronyms = {}
+                categories = {}
+                cursor.execute('SELECT acronym, definition, category FROM custom_acronyms ORDER BY acronym')
+                for acronym, definition, category in cursor:
+                    acronyms[acronym] = definition
+                    categories.setdefault(category or 'General', []).append(acronym)
+                exported_count = len(acronyms)
+                
                 export_data = {
-                    'acronyms': {row[0]: row[1] for row in rows},
-                    'categories': {},
+                    'acronyms': acronyms,
+                    'categories': categories,
                     'exported_at': datetime.now().isoformat(),
-                    'total_count': len(rows)
+                    'total_count': exported_count
                 }
                 
-                # Group by categories
-                for row in rows:
-                    category = row[2] or 'General'
-                    if category not in export_data['categories']:
-                        export_data['categories'][category] = []
-                    export_data['categories'][category].append(row[0])
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                with open(file_path, 'wb') as f:
+                    f.write(_dumps(export_data))
                     
             elif format.lower() == 'csv':
+                # Stream rows from the cursor straight into the writer
+                import csv
+                
                 with open(file_path, 'w', encoding='utf-8', newline='') as f:
                     writer = csv.writer(f)
                     writer.writerow(['acronym', 'definition', 'category'])
-                    writer.writerows(rows)
+                    cursor.execute('SELECT acronym, definition, category FROM custom_acronyms ORDER BY acronym')
+                    writer.writerows(cursor)
+                
+                cursor.execute('SELECT COUNT(*) FROM custom_acronyms')
+                exported_count = cursor.fetchone()[0]
             
-            print(f"✅ Export completed: {len(rows)} acronyms exported")
+            print(f"✅ Export completed: {exported_count} acronyms exported")
             
         except Exception as e:
             print(f"❌ Export error: {e}")
-        finally:
-            conn.close()
+
+    def refresh_rollups(self):
+        """Bring daily_acronym_counts up to date with tooltip_interactions"""
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        
+        with conn:
+            cursor.execute('BEGIN')
+            
+            # Everything from the last rolled-up day onwards is recounted, since
+            # that day may have gained interactions after the previous refresh
+            cursor.execute(_Q_ROLLUP_WATERMARK)
+            row = cursor.fetchone()
+            watermark = row[0] if row else ''
+            
+            cursor.execute(_Q_ROLLUP_REFRESH, (watermark,))
+            
+            cursor.execute(_Q_ROLLUP_LATEST_DAY)
+            latest_day = cursor.fetchone()[0]
+            if latest_day:
+                cursor.execute(_Q_ROLLUP_SET_WATERMARK, (latest_day,))
 
     def generate_analytics_report(self, days=30):
         """Generate analytics report for the specified period"""
         print(f"📊 Generating analytics report for last {days} days...")
         
-        conn = sqlite3.connect(self.db_path)
+        self.refresh_rollups()
+        
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         # Date range
@@ -178,35 +458,21 @@ class TooltipSystemManager:
         start_date = end_date - timedelta(days=days)
         
         # Most popular acronyms
-        cursor.execute('''
-            SELECT acronym, COUNT(*) as interactions
-            FROM tooltip_interactions
-            WHERE timestamp > ?
-            GROUP BY acronym
-            ORDER BY interactions DESC
-            LIMIT 10
-        ''', (start_date.isoformat(),))
+        cursor.execute(_Q_POPULAR, (start_date.date().isoformat(),))
         popular_acronyms = cursor.fetchall()
         
         # Search statistics
-        cursor.execute('''
-            SELECT COUNT(*) as total_searches,
-                   COUNT(DISTINCT query) as unique_queries
-            FROM search_queries
-            WHERE timestamp > ?
-        ''', (start_date.isoformat(),))
+        cursor.execute(_Q_SEARCH_STATS, (start_date.isoformat(),))
         search_stats = cursor.fetchone()
         
         # Daily interaction trends
-        cursor.execute('''
-            SELECT DATE(timestamp) as day, COUNT(*) as interactions
-            FROM tooltip_interactions
-            WHERE timestamp > ?
-            GROUP BY DATE(timestamp)
-            ORDER BY day
-        ''', (start_date.isoformat(),))
+        cursor.execute(_Q_DAILY, (start_date.date().isoformat(),))
         daily_trends = cursor.fetchall()
         
+        # Total interactions over the period
+        cursor.execute(_Q_TOTAL, (start_date.date().isoformat(),))
+        total_interactions = cursor.fetchone()[0]
+        
         # Generate report
         report = {
             'period': f'{start_date.date()} to {end_date.date()}',
@@ -220,14 +486,14 @@ class TooltipSystemManager:
         
         # Save report
         report_file = f"analytics_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(report_file, 'wb') as f:
+            f.write(_dumps(report))
         
         print(f"✅ Analytics report saved: {report_file}")
         
         # Display summary
         print("\n📈 Analytics Summary:")
-        print(f"   Total interactions: {sum(trend['interactions'] for trend in report['daily_trends'])}")
+        print(f"   Total interactions: {total_interactions}")
         print(f"   Total searches: {report['search_statistics']['total_searches']}")
         print(f"   Unique queries: {report['search_statistics']['unique_queries']}")
         
@@ -235,8 +501,6 @@ class TooltipSystemManager:
             print(f"\n🔥 Top 5 Most Popular Acronyms:")
             for i, acronym in enumerate(popular_acronyms[:5], 1):
                 print(f"   {i}. {acronym[0]} ({acronym[1]} interactions)")
-        
-        conn.close()
 
     def cleanup_old_data(self, days=90):
         """Remove old analytics data to keep database size manageable"""
@@ -244,19 +508,32 @@ class TooltipSystemManager:
         
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        # Clean old interactions
-        cursor.execute('DELETE FROM tooltip_interactions WHERE timestamp < ?', (cutoff_date.isoformat(),))
-        interactions_deleted = cursor.rowcount
-        
-        # Clean old searches
-        cursor.execute('DELETE FROM search_queries WHERE timestamp < ?', (cutoff_date.isoformat(),))
-        searches_deleted = cursor.rowcount
+        # Both deletes and the rollup trim commit together
+        with conn:
+            cursor.execute('BEGIN')
+            
+            # Clean old interactions
+            cursor.execute(_Q_CLEANUP_TI, (cutoff_date.isoformat(),))
+            interactions_deleted = cursor.rowcount
+            
+            # Clean old searches
+            cursor.execute(_Q_CLEANUP_SQ, (cutoff_date.isoformat(),))
+            searches_deleted = cursor.rowcount
+            
+            # Drop rolled-up days that are gone and recount the partially trimmed cutoff day
+            cutoff_day = cutoff_date.date()
+            cursor.execute(_Q_CLEANUP_ROLLUP, (cutoff_day.isoformat(),))
+            cursor.execute(_Q_ROLLUP_RECOUNT_DAY, (cutoff_day.isoformat(), (cutoff_day + timedelta(days=1)).isoformat()))
         
-        conn.commit()
-        conn.close()
+        # Hand freed pages back to the filesystem on databases created with incremental auto-vacuum
+        cursor.execute('PRAGMA auto_vacuum')
+        if cursor.fetchone()[0] == 2:
+            # execute() steps the pragma only once, freeing a single page;
+            # executescript() runs it to completion
+            cursor.executescript('PRAGMA incremental_vacuum')
         
         print(f"✅ Cleanup completed: {interactions_deleted} interactions, {searches_deleted} searches removed")
 
@@ -269,24 +546,16 @@ class TooltipSystemManager:
         if os.path.exists(self.db_path):
             print(f"✅ Database: {self.db_path}")
             
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             
-            # Count records
-            cursor.execute('SELECT COUNT(*) FROM tooltip_interactions')
-            interactions = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM search_queries')
-            searches = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM custom_acronyms')
-            custom_acronyms = cursor.fetchone()[0]
+            # Count records in one round trip
+            cursor.execute(_Q_STATUS_COUNTS)
+            interactions, searches, custom_acronyms = cursor.fetchone()
             
             print(f"   📊 Total interactions: {interactions}")
             print(f"   🔍 Total searches: {searches}")
             print(f"   📝 Custom acronyms: {custom_acronyms}")
-            
-            conn.close()
         else:
             print(f"❌ Database not found: {self.db_path}")
         
@@ -300,10 +569,25 @@ class TooltipSystemManager:
             'static/css/tooltip_enhancements.css'
         ]
         
+        # One directory listing per parent instead of an exists + getsize pair per file
+        wanted = {}
+        for file_path in files_to_check:
+            parent, name = os.path.split(file_path)
+            wanted.setdefault(parent, set()).add(name)
+        
+        sizes = {}
+        for parent, names in wanted.items():
+            try:
+                with os.scandir(parent or '.') as it:
+                    sizes[parent] = {e.name: e.stat().st_size for e in it if e.name in names and e.is_file()}
+            except OSError:
+                sizes[parent] = {}
+        
         print("\n📁 File Status:")
         for file_path in files_to_check:
-            if os.path.exists(file_path):
-                size = os.path.getsize(file_path)
+            parent, name = os.path.split(file_path)
+            size = sizes[parent].get(name)
+            if size is not None:
                 print(f"   ✅ {file_path} ({size:,} bytes)")
             else:
                 print(f"   ❌ {file_path} (missing)")
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the Enhanced Telecommunications Laboratory
+
+Production deployment (Linux/macOS):
+    gunicorn -w 4 --preload --worker-class gthread --threads 2 -b 0.0.0.0:5000 wsgi:app
+
+--preload imports flask_telecom_server once in the master process, so the
+matplotlib style setup and the precomputed BER, constellation and topology
+arrays are shared with the forked workers copy-on-write.
+"""
+
+from flask_telecom_server import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000)